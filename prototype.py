@@ -2,16 +2,10 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import time
 import re
+from collections import deque
 import json
-from typing import List, Dict, Tuple
-import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from io import BytesIO
-import base64
+from typing import List, Dict, Tuple, Optional
 
 # Configure page
 st.set_page_config(
@@ -118,24 +112,78 @@ class LegalAI:
             "severability": "If one part of contract is invalid, the rest remains enforceable",
             "governing law": "Which state or country's laws apply to the contract"
         }
+        self.high_importance_terms = frozenset({'liability', 'governing law', 'arbitration'})
+        # One alternation over every term; the lookahead makes matches
+        # zero-width so overlapping terms are all reported in a single scan
+        self.terms_re = re.compile(
+            '(?=(' + '|'.join(re.escape(term) for term in self.legal_terms_db) + '))'
+        )
+        
+        # Legalese -> plain English rewrites, fused into one alternation so
+        # the text is scanned once; group N maps to replacement N-1
+        simplified_patterns = [
+            (r'\bwhereas\b', 'Since'),
+            (r'\bheretofore\b', 'before this'),
+            (r'\bhereinafter\b', 'from now on'),
+            (r'\bnotwithstanding\b', 'despite'),
+            (r'\bpursuant to\b', 'according to'),
+            (r'\bshall\b', 'must'),
+            (r'\bmay\b', 'can'),
+            (r'\bparty of the first part\b', 'first party'),
+            (r'\bparty of the second part\b', 'second party'),
+        ]
+        self.simplify_re = re.compile(
+            '|'.join(f'({pattern})' for pattern, _ in simplified_patterns),
+            re.IGNORECASE
+        )
+        self.simplify_replacements = [replacement for _, replacement in simplified_patterns]
+        
+        # Risk / obligation keywords, matched as substrings of a lowercased
+        # sentence (so 'terminate' also flags 'terminated')
+        risk_keywords = ['liable', 'penalty', 'breach', 'default', 'terminate', 'forfeit', 'damages']
+        # Subset of the risk keywords that mark a risk as high severity
+        self.severe_keywords = frozenset({'penalty', 'damages', 'forfeit'})
+        obligation_keywords = ['must', 'shall', 'required', 'obligated', 'responsible', 'duty']
+        
+        self.sentence_re = re.compile(r'[^.]+')
+        # Both keyword groups in one alternation so each sentence is scanned
+        # once; zero-width matches report every keyword occurrence
+        self.keyword_re = re.compile(
+            '(?=(?P<risk>' + '|'.join(risk_keywords) + ')'
+            '|(?P<obligation>' + '|'.join(obligation_keywords) + '))'
+        )
         
-    def extract_key_terms(self, text: str) -> List[Dict]:
+    def extract_key_terms(self, text: str, text_lower: Optional[str] = None) -> List[Dict]:
         """Extract and explain legal terms from text"""
         terms_found = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Offset of the first occurrence of each term
+        first_seen = {}
+        for match in self.terms_re.finditer(text_lower):
+            first_seen.setdefault(match.group(1), match.start())
+        
+        # Offsets come from the lowercased copy; in the rare case lowercasing
+        # changed the length, slice that copy so the offsets stay valid
+        source = text if len(text) == len(text_lower) else text_lower
         
         for term, definition in self.legal_terms_db.items():
-            if term in text_lower:
-                # Find context around the term
-                pattern = rf'.{{0,50}}{re.escape(term)}.{{0,50}}'
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                context = matches[0] if matches else ""
+            if term in first_seen:
+                # Up to 50 characters either side of the term, within its line
+                start = first_seen[term]
+                end = start + len(term)
+                line_start = source.rfind('\n', 0, start) + 1
+                line_end = source.find('\n', end)
+                if line_end == -1:
+                    line_end = len(source)
+                context = source[max(line_start, start - 50):min(line_end, end + 50)]
                 
                 terms_found.append({
                     'term': term.title(),
                     'definition': definition,
                     'context': context,
-                    'importance': 'High' if term in ['liability', 'governing law', 'arbitration'] else 'Medium'
+                    'importance': 'High' if term in self.high_importance_terms else 'Medium'
                 })
         
         return terms_found
@@ -143,43 +191,27 @@ class LegalAI:
     def simplify_legal_text(self, text: str) -> str:
         """Simulate LLM simplification of legal text"""
         # In production, this would call an actual LLM API
-        time.sleep(1)  # Simulate API call delay
-        
-        simplified_patterns = [
-            (r'\bwhereas\b', 'Since'),
-            (r'\bheretofore\b', 'before this'),
-            (r'\bhereinafter\b', 'from now on'),
-            (r'\bnotwithstanding\b', 'despite'),
-            (r'\bpursuant to\b', 'according to'),
-            (r'\bshall\b', 'must'),
-            (r'\bmay\b', 'can'),
-            (r'\bparty of the first part\b', 'first party'),
-            (r'\bparty of the second part\b', 'second party'),
-        ]
-        
-        simplified = text
-        for pattern, replacement in simplified_patterns:
-            simplified = re.sub(pattern, replacement, simplified, flags=re.IGNORECASE)
-        
-        return simplified
+        return self.simplify_re.sub(lambda m: self.simplify_replacements[m.lastindex - 1], text)
     
-    def analyze_document_structure(self, text: str) -> Dict:
+    def analyze_document_structure(self, text: str, text_lower: Optional[str] = None) -> Dict:
         """Analyze document structure and provide insights"""
+        if text_lower is None:
+            text_lower = text.lower()
         word_count = len(text.split())
-        sentence_count = len([s for s in text.split('.') if s.strip()])
+        sentence_count = sum(1 for s in text.split('.') if s.strip())
         
         # Mock complexity analysis
         complexity_score = min(100, word_count / 10 + sentence_count / 5)
         readability = 100 - complexity_score
         
         sections = []
-        if 'whereas' in text.lower():
+        if 'whereas' in text_lower:
             sections.append('Recitals/Background')
-        if 'agree' in text.lower():
+        if 'agree' in text_lower:
             sections.append('Agreement Terms')
-        if 'terminate' in text.lower():
+        if 'terminate' in text_lower:
             sections.append('Termination Clauses')
-        if 'govern' in text.lower():
+        if 'govern' in text_lower:
             sections.append('Governing Law')
         
         return {
@@ -191,38 +223,225 @@ class LegalAI:
             'sections_identified': sections
         }
     
-    def identify_risks_and_obligations(self, text: str) -> Dict:
+    def identify_risks_and_obligations(self, text: str, text_lower: Optional[str] = None) -> Dict:
         """Identify potential risks and obligations"""
-        risk_keywords = ['liable', 'penalty', 'breach', 'default', 'terminate', 'forfeit', 'damages']
-        obligation_keywords = ['must', 'shall', 'required', 'obligated', 'responsible', 'duty']
-        
         risks = []
         obligations = []
         
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
+        # Walk sentence spans lazily; lowercasing never adds or removes '.',
+        # so the scans over both copies line up. Only the top 5 of each are
+        # reported, so stop once both are full.
+        for match, match_lower in zip(self.sentence_re.finditer(text), self.sentence_re.finditer(text_lower)):
+            sentence = match.group().strip()
+            if not sentence:
+                continue
+            sentence_lower = match_lower.group()
+            
+            hits = self.keyword_re.findall(sentence_lower)
+            risk_hits = {risk for risk, _ in hits if risk}
             
-            if any(keyword in sentence_lower for keyword in risk_keywords):
+            # Severe keywords are risk keywords too, so the risk matches
+            # alone decide the severity
+            if len(risks) < 5 and risk_hits:
                 risks.append({
                     'text': sentence,
-                    'severity': 'High' if any(word in sentence_lower for word in ['penalty', 'damages', 'forfeit']) else 'Medium'
+                    'severity': 'High' if self.severe_keywords & risk_hits else 'Medium'
                 })
             
-            if any(keyword in sentence_lower for keyword in obligation_keywords):
+            if len(obligations) < 5 and any(obligation for _, obligation in hits):
                 obligations.append({
                     'text': sentence,
                     'type': 'Legal Obligation'
                 })
+            
+            if len(risks) >= 5 and len(obligations) >= 5:
+                break
         
         return {
-            'risks': risks[:5],  # Top 5 risks
-            'obligations': obligations[:5]  # Top 5 obligations
+            'risks': risks,
+            'obligations': obligations
         }
 
-# Initialize AI
-legal_ai = LegalAI()
+# Initialize AI once per process: Streamlit re-executes this script on every
+# rerun, so the instance and its compiled matchers are kept as a resource
+@st.cache_resource
+def load_legal_ai() -> LegalAI:
+    return LegalAI()
+
+legal_ai = load_legal_ai()
+
+# Cached entry points for the UI: every analysis is a pure function of the
+# document text, so widget-triggered reruns reuse the previous results.
+# `_text_lower` is derived from `text`, so it is left out of the cache key.
+@st.cache_data(show_spinner=False, max_entries=128)
+def extract_key_terms(text: str, _text_lower: Optional[str] = None) -> List[Dict]:
+    return legal_ai.extract_key_terms(text, _text_lower)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def simplify_legal_text(text: str) -> str:
+    return legal_ai.simplify_legal_text(text)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def analyze_document_structure(text: str, _text_lower: Optional[str] = None) -> Dict:
+    return legal_ai.analyze_document_structure(text, _text_lower)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def identify_risks_and_obligations(text: str, _text_lower: Optional[str] = None) -> Dict:
+    return legal_ai.identify_risks_and_obligations(text, _text_lower)
+
+# Static mock tables, built once instead of on every rerun
+@st.cache_data(show_spinner=False)
+def word_freq_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Word': ['Agreement', 'Party', 'Terms', 'Shall', 'Rights', 'Obligations'],
+        'Frequency': [15, 12, 10, 8, 7, 6]
+    })
+
+@st.cache_data(show_spinner=False)
+def document_library_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Document': ['Employment Contract - John Doe', 'Software License Agreement', 'Terms of Service v2.1'],
+        'Type': ['Employment', 'License', 'Terms'],
+        'Pages': [5, 12, 8],
+        'Last Modified': ['2024-01-15', '2024-01-10', '2024-01-05'],
+        'Status': ['✅ Processed', '✅ Processed', '⏳ Processing']
+    })
+
+@st.cache_data(show_spinner=False)
+def doc_types_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Type': ['Employment', 'Lease', 'Terms of Service', 'License', 'Other'],
+        'Count': [45, 32, 28, 15, 7]
+    })
+
+@st.cache_data(show_spinner=False)
+def recent_activity_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Time': ['2 mins ago', '15 mins ago', '1 hour ago', '3 hours ago'],
+        'Action': ['Document analyzed', 'Terms explained', 'Risk assessment completed', 'New user registered'],
+        'Document': ['Employment Contract', 'Lease Agreement', 'Terms of Service', 'N/A'],
+        'Status': ['✅ Complete', '✅ Complete', '✅ Complete', '✅ Complete']
+    })
+
+# Mock complexity history; seeded so the chart is stable across reruns
+@st.cache_data(show_spinner=False)
+def complexity_series(n: int = 30, start: str = '2024-01-01') -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Date': pd.date_range(start, periods=n, freq='D'),
+        'Avg_Complexity': rng.normal(60, 10, n)
+    })
+
+# Chart builders, cached so reruns with unchanged data reuse the figure.
+# Plotly is imported on first use so pages without charts never load it.
+@st.cache_data(show_spinner=False)
+def build_complexity_gauge(score: float):
+    import plotly.graph_objects as go
+    return go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Document Complexity"},
+        delta = {'reference': 50},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 30], 'color': "lightgreen"},
+                {'range': [30, 70], 'color': "yellow"},
+                {'range': [70, 100], 'color': "red"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+
+@st.cache_data(show_spinner=False)
+def build_word_freq_bar(word_freq_data: pd.DataFrame):
+    import plotly.express as px
+    return px.bar(
+        word_freq_data, 
+        x='Word', 
+        y='Frequency',
+        title="Most Common Legal Terms",
+        color='Frequency',
+        color_continuous_scale='Blues'
+    )
+
+@st.cache_data(show_spinner=False)
+def build_doc_types_pie(doc_types: pd.DataFrame):
+    import plotly.express as px
+    return px.pie(doc_types, values='Count', names='Type', title="Document Distribution")
+
+@st.cache_data(show_spinner=False)
+def build_complexity_trend(complexity_data: pd.DataFrame):
+    import plotly.express as px
+    return px.line(complexity_data, x='Date', y='Avg_Complexity', 
+                   title="Average Document Complexity Over Time")
+
+# Mock AI responses based on question type, in priority order
+QA_RESPONSES = {
+    'contract': "A contract is a legally binding agreement between two or more parties. Key elements include offer, acceptance, consideration, and mutual intent. Would you like me to analyze a specific contract for you?",
+    'liability': "Liability refers to legal responsibility for one's actions or debts. It can be limited or unlimited depending on the context. In contracts, liability clauses often specify what each party is responsible for if something goes wrong.",
+    'termination': "Contract termination can happen in several ways: mutual agreement, completion of terms, breach by one party, or specific termination clauses. Always check your contract for notice periods and termination procedures."
+}
+QA_DEFAULT_RESPONSE = "That's a great question about '{prompt}'. Legal matters can be complex, and I'd recommend reviewing the specific terms in your documents or consulting with a qualified attorney for personalized advice. Is there a particular document you'd like me to analyze?"
+
+# One scan finds every topic keyword; the lookahead keeps matches zero-width
+# so an earlier low-priority hit can't hide an overlapping higher-priority one
+QA_TOPIC_RE = re.compile(
+    r'(?=(?P<contract>contract|agreement)|(?P<liability>liability|responsible)|(?P<termination>terminate|end|cancel))',
+    re.IGNORECASE
+)
+
+# Cached so repeated questions (e.g. suggested ones) skip classification
+@st.cache_data(show_spinner=False, max_entries=256)
+def canned_response(prompt: str) -> str:
+    topics = {match.lastgroup for match in QA_TOPIC_RE.finditer(prompt)}
+    for topic, response in QA_RESPONSES.items():
+        if topic in topics:
+            return response
+    return QA_DEFAULT_RESPONSE.format(prompt=prompt)
+
+# Home page cards, rendered once into a single markdown block each
+FEATURES = [
+    ("🔍 Smart Analysis", "AI-powered document parsing and term extraction"),
+    ("📝 Plain English Translation", "Convert legal jargon to understandable language"),
+    ("⚠️ Risk Assessment", "Identify potential risks and obligations"),
+    ("📊 Visual Insights", "Charts and analytics for document complexity"),
+    ("💬 Interactive Q&A", "Ask questions about your documents"),
+    ("🔒 Secure Processing", "Your documents are processed securely")
+]
+
+STATS = [
+    ("Documents Analyzed", "10,247"),
+    ("Terms Simplified", "25,891"),
+    ("Users Helped", "3,456"),
+    ("Success Rate", "94.2%")
+]
+
+FEATURE_CARD_TEMPLATE = """
+<div class="feature-card">
+    <h4>{title}</h4>
+    <p>{desc}</p>
+</div>
+"""
+
+STAT_CARD_TEMPLATE = """
+<div class="metric-card">
+    <h3>{value}</h3>
+    <p>{name}</p>
+</div>
+"""
+
+FEATURE_CARDS_HTML = "".join(FEATURE_CARD_TEMPLATE.format(title=title, desc=desc) for title, desc in FEATURES)
+STAT_CARDS_HTML = "".join(STAT_CARD_TEMPLATE.format(value=value, name=name) for name, value in STATS)
 
 # Header
 st.markdown("""
@@ -277,41 +496,13 @@ if page == "🏠 Home":
         """, unsafe_allow_html=True)
         
         # Key features
-        features = [
-            ("🔍 Smart Analysis", "AI-powered document parsing and term extraction"),
-            ("📝 Plain English Translation", "Convert legal jargon to understandable language"),
-            ("⚠️ Risk Assessment", "Identify potential risks and obligations"),
-            ("📊 Visual Insights", "Charts and analytics for document complexity"),
-            ("💬 Interactive Q&A", "Ask questions about your documents"),
-            ("🔒 Secure Processing", "Your documents are processed securely")
-        ]
-        
-        for title, desc in features:
-            st.markdown(f"""
-            <div class="feature-card">
-                <h4>{title}</h4>
-                <p>{desc}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     with col2:
         st.markdown("### 📈 Platform Stats")
         
         # Mock statistics
-        stats = [
-            ("Documents Analyzed", "10,247"),
-            ("Terms Simplified", "25,891"),
-            ("Users Helped", "3,456"),
-            ("Success Rate", "94.2%")
-        ]
-        
-        for stat_name, stat_value in stats:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>{stat_value}</h3>
-                <p>{stat_name}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(STAT_CARDS_HTML, unsafe_allow_html=True)
         
         st.markdown("### 🚀 Get Started")
         st.info("👈 Use the sidebar to navigate to different tools or upload a document to begin analysis!")
@@ -354,8 +545,11 @@ elif page == "📄 Document Analyzer":
     
     if document_text and st.button("🔍 Analyze Document", type="primary"):
         with st.spinner("🤖 AI is analyzing your document..."):
+            # Lowercased once and shared by every analysis below
+            document_lower = document_text.lower()
+            
             # Document structure analysis
-            structure_analysis = legal_ai.analyze_document_structure(document_text)
+            structure_analysis = analyze_document_structure(document_text, document_lower)
             
             # Create tabs for different analyses
             tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -411,7 +605,7 @@ elif page == "📄 Document Analyzer":
                 st.markdown("### 📝 Simplified Version")
                 
                 with st.spinner("🤖 Translating to plain English..."):
-                    simplified_text = legal_ai.simplify_legal_text(document_text)
+                    simplified_text = simplify_legal_text(document_text)
                 
                 st.markdown("#### Original Text:")
                 st.markdown(f"""
@@ -439,7 +633,7 @@ elif page == "📄 Document Analyzer":
             with tab3:
                 st.markdown("### ⚖️ Legal Terms Explained")
                 
-                key_terms = legal_ai.extract_key_terms(document_text)
+                key_terms = extract_key_terms(document_text, document_lower)
                 
                 if key_terms:
                     for term in key_terms:
@@ -459,7 +653,7 @@ elif page == "📄 Document Analyzer":
             with tab4:
                 st.markdown("### ⚠️ Risks & Obligations Analysis")
                 
-                risk_analysis = legal_ai.identify_risks_and_obligations(document_text)
+                risk_analysis = identify_risks_and_obligations(document_text, document_lower)
                 
                 col1, col2 = st.columns(2)
                 
@@ -494,45 +688,15 @@ elif page == "📄 Document Analyzer":
                 st.markdown("### 📈 Document Analytics")
                 
                 # Complexity visualization
-                fig_complexity = go.Figure(go.Indicator(
-                    mode = "gauge+number+delta",
-                    value = structure_analysis['complexity_score'],
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': "Document Complexity"},
-                    delta = {'reference': 50},
-                    gauge = {
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [0, 30], 'color': "lightgreen"},
-                            {'range': [30, 70], 'color': "yellow"},
-                            {'range': [70, 100], 'color': "red"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ))
+                fig_complexity = build_complexity_gauge(structure_analysis['complexity_score'])
                 
                 st.plotly_chart(fig_complexity, use_container_width=True)
                 
                 # Word frequency (mock data)
                 st.markdown("#### 📊 Key Word Frequency")
-                word_freq_data = pd.DataFrame({
-                    'Word': ['Agreement', 'Party', 'Terms', 'Shall', 'Rights', 'Obligations'],
-                    'Frequency': [15, 12, 10, 8, 7, 6]
-                })
+                word_freq_data = word_freq_df()
                 
-                fig_bar = px.bar(
-                    word_freq_data, 
-                    x='Word', 
-                    y='Frequency',
-                    title="Most Common Legal Terms",
-                    color='Frequency',
-                    color_continuous_scale='Blues'
-                )
+                fig_bar = build_word_freq_bar(word_freq_data)
                 st.plotly_chart(fig_bar, use_container_width=True)
 
 elif page == "🔍 Smart Search":
@@ -549,13 +713,7 @@ elif page == "🔍 Smart Search":
         st.markdown("### 📚 Document Library")
         
         # Mock document library
-        documents_df = pd.DataFrame({
-            'Document': ['Employment Contract - John Doe', 'Software License Agreement', 'Terms of Service v2.1'],
-            'Type': ['Employment', 'License', 'Terms'],
-            'Pages': [5, 12, 8],
-            'Last Modified': ['2024-01-15', '2024-01-10', '2024-01-05'],
-            'Status': ['✅ Processed', '✅ Processed', '⏳ Processing']
-        })
+        documents_df = document_library_df()
         
         st.dataframe(documents_df, use_container_width=True)
     
@@ -567,8 +725,6 @@ elif page == "🔍 Smart Search":
     
     if search_query and st.button("🔍 Search"):
         with st.spinner("🤖 Searching across documents..."):
-            time.sleep(1)
-            
             st.markdown("### 🎯 Search Results")
             
             # Mock search results
@@ -619,34 +775,21 @@ elif page == "📊 Analytics Dashboard":
     
     with col1:
         st.markdown("### 📈 Document Types Processed")
-        doc_types = pd.DataFrame({
-            'Type': ['Employment', 'Lease', 'Terms of Service', 'License', 'Other'],
-            'Count': [45, 32, 28, 15, 7]
-        })
+        doc_types = doc_types_df()
         
-        fig_pie = px.pie(doc_types, values='Count', names='Type', title="Document Distribution")
+        fig_pie = build_doc_types_pie(doc_types)
         st.plotly_chart(fig_pie, use_container_width=True)
     
     with col2:
         st.markdown("### 📊 Complexity Trends")
-        dates = pd.date_range('2024-01-01', periods=30, freq='D')
-        complexity_data = pd.DataFrame({
-            'Date': dates,
-            'Avg_Complexity': np.random.normal(60, 10, 30)
-        })
+        complexity_data = complexity_series()
         
-        fig_line = px.line(complexity_data, x='Date', y='Avg_Complexity', 
-                          title="Average Document Complexity Over Time")
+        fig_line = build_complexity_trend(complexity_data)
         st.plotly_chart(fig_line, use_container_width=True)
     
     # Recent activity
     st.markdown("### 🔄 Recent Activity")
-    recent_activity = pd.DataFrame({
-        'Time': ['2 mins ago', '15 mins ago', '1 hour ago', '3 hours ago'],
-        'Action': ['Document analyzed', 'Terms explained', 'Risk assessment completed', 'New user registered'],
-        'Document': ['Employment Contract', 'Lease Agreement', 'Terms of Service', 'N/A'],
-        'Status': ['✅ Complete', '✅ Complete', '✅ Complete', '✅ Complete']
-    })
+    recent_activity = recent_activity_df()
     
     st.dataframe(recent_activity, use_container_width=True)
 
@@ -655,11 +798,11 @@ elif page == "❓ Legal Q&A":
     
     st.info("💬 Ask questions about legal concepts, your documents, or get general legal guidance!")
     
-    # Chat interface
+    # Chat interface; only the most recent messages are kept so reruns stay cheap
     if 'messages' not in st.session_state:
-        st.session_state.messages = [
+        st.session_state.messages = deque([
             {"role": "assistant", "content": "Hello! I'm your Legal AI Assistant. I can help explain legal terms, analyze contracts, and answer questions about legal documents. What would you like to know?"}
-        ]
+        ], maxlen=50)
     
     # Display chat messages
     for message in st.session_state.messages:
@@ -676,18 +819,7 @@ elif page == "❓ Legal Q&A":
         # Generate assistant response
         with st.chat_message("assistant"):
             with st.spinner("🤖 Thinking..."):
-                time.sleep(1)  # Simulate processing time
-                
-                # Mock AI responses based on question type
-                if any(word in prompt.lower() for word in ['contract', 'agreement']):
-                    response = "A contract is a legally binding agreement between two or more parties. Key elements include offer, acceptance, consideration, and mutual intent. Would you like me to analyze a specific contract for you?"
-                elif any(word in prompt.lower() for word in ['liability', 'responsible']):
-                    response = "Liability refers to legal responsibility for one's actions or debts. It can be limited or unlimited depending on the context. In contracts, liability clauses often specify what each party is responsible for if something goes wrong."
-                elif any(word in prompt.lower() for word in ['terminate', 'end', 'cancel']):
-                    response = "Contract termination can happen in several ways: mutual agreement, completion of terms, breach by one party, or specific termination clauses. Always check your contract for notice periods and termination procedures."
-                else:
-                    response = f"That's a great question about '{prompt}'. Legal matters can be complex, and I'd recommend reviewing the specific terms in your documents or consulting with a qualified attorney for personalized advice. Is there a particular document you'd like me to analyze?"
-                
+                response = canned_response(prompt)
                 st.markdown(response)
         
         # Add assistant response to chat history